@@ -2,52 +2,150 @@
 Application settings and configuration.
 
 Centralizes all configuration with environment variable support.
+Settings are read from the environment once, when the module is imported.
 """
 
+import logging
 import os
-from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Content codings supported for request bodies; empty disables compression
+_REQUEST_CODINGS = ("zstd", "gzip", "")
+
+
+def _parse_request_coding(value: str) -> str:
+    """Validate the request body coding, disabling compression if unknown."""
+    coding = value.strip().lower()
+    if coding not in _REQUEST_CODINGS:
+        logger.warning("Ignoring unknown HTTP_REQUEST_COMPRESSION %r", value)
+        return ""
+    return coding
+
+
+def _parse_pool_size(value: str, default: int = 8) -> int:
+    """Parse a worker count, falling back to the default if not a positive integer."""
+    try:
+        size = int(value)
+    except ValueError:
+        size = 0
+    if size < 1:
+        logger.warning("Ignoring invalid CLAIM_HTTP_POOL %r, using %d", value, default)
+        return default
+    return size
+
+
+def _parse_rate_limits(value: str) -> Dict[str, Tuple[float, float]]:
+    """
+    Parse "host=rate/period,..." into {host: (rate, period)}.
+    
+    The period is in seconds and defaults to 1 when omitted. Malformed
+    entries and non-positive rates or periods are logged and skipped.
+    """
+    limits = {}
+    for entry in filter(None, (part.strip() for part in value.split(","))):
+        host, _, limit = entry.partition("=")
+        rate, _, period = limit.partition("/")
+        try:
+            parsed = (float(rate), float(period or 1))
+        except ValueError:
+            parsed = None
+        if not host.strip() or parsed is None or min(parsed) <= 0:
+            logger.warning("Ignoring invalid HTTP_RATE_LIMITS entry %r", entry)
+            continue
+        limits[host.strip()] = parsed
+    return limits
+
 
-@dataclass(frozen=True)
 class APIEndpoints:
     """Hugging Face API endpoints."""
-    ner: str = os.getenv("HF_NER_URL")
-    classify: str = os.getenv("HF_CLASSIFY_URL")
-    summarize: str = os.getenv("HF_SUMMARIZE_URL")
-    describe_image: str = os.getenv("HF_DESCRIBE_URL")
-    signature: str = os.getenv("HF_SIGNATURE_URL")
-    stamp: str = os.getenv("HF_STAMP_URL")
-    extract_text: str = os.getenv("HF_TEXT_URL")
-    extract_tables: str = os.getenv("HF_TABLES_URL")
-    translate: str = os.getenv("HF_TRANSLATE_URL")
-
-
-@dataclass(frozen=True)
+    __slots__ = (
+        "ner", "classify", "summarize", "describe_image", "signature",
+        "stamp", "extract_text", "extract_tables", "translate"
+    )
+
+    def __init__(self) -> None:
+        self.ner: str = os.getenv("HF_NER_URL", "")
+        self.classify: str = os.getenv("HF_CLASSIFY_URL", "")
+        self.summarize: str = os.getenv("HF_SUMMARIZE_URL", "")
+        self.describe_image: str = os.getenv("HF_DESCRIBE_URL", "")
+        self.signature: str = os.getenv("HF_SIGNATURE_URL", "")
+        self.stamp: str = os.getenv("HF_STAMP_URL", "")
+        self.extract_text: str = os.getenv("HF_TEXT_URL", "")
+        self.extract_tables: str = os.getenv("HF_TABLES_URL", "")
+        self.translate: str = os.getenv("HF_TRANSLATE_URL", "")
+
+
 class LLMSettings:
     """LLM configuration."""
-    model: str = os.getenv("LLM_MODEL", "gemini-2.5-flash-lite")
-    temperature: float = float(os.getenv("LLM_TEMPERATURE", "0.0"))
-    api_key: str = field(default_factory=lambda: os.getenv("GOOGLE_API_KEY", ""))
+    __slots__ = ("model", "temperature", "api_key")
+
+    def __init__(self) -> None:
+        self.model: str = os.getenv("LLM_MODEL", "gemini-2.5-flash-lite")
+        self.temperature: float = float(os.getenv("LLM_TEMPERATURE", "0.0"))
+        self.api_key: str = os.getenv("GOOGLE_API_KEY", "")
 
 
-@dataclass(frozen=True)
 class ProcessingSettings:
     """Document processing settings."""
-    language: str = os.getenv("PROCESSING_LANGUAGE", "en")
-    default_start_page: int = 1
-    default_end_page: int = 10
+    __slots__ = ("language", "default_start_page", "default_end_page")
+
+    def __init__(self) -> None:
+        self.language: str = os.getenv("PROCESSING_LANGUAGE", "en")
+        self.default_start_page: int = 1
+        self.default_end_page: int = 10
+
+
+class HTTPSettings:
+    """Outbound HTTP settings."""
+    __slots__ = (
+        "pool_workers", "request_compression", "batch_text_urls", "multi_file_urls", "rate_limits"
+    )
+
+    def __init__(self) -> None:
+        # Worker threads for concurrent sync batch requests
+        self.pool_workers: int = _parse_pool_size(os.getenv("CLAIM_HTTP_POOL", "8"))
+        # Content-Encoding for large text request bodies: zstd, gzip, or empty (off)
+        self.request_compression: str = _parse_request_coding(
+            os.getenv("HTTP_REQUEST_COMPRESSION", "")
+        )
+        # Comma-separated endpoints that accept {"inputs": [...]} JSON text batches
+        self.batch_text_urls: frozenset = frozenset(
+            url.strip() for url in os.getenv("HTTP_BATCH_TEXT_URLS", "").split(",") if url.strip()
+        )
+        # Comma-separated endpoints that accept several files (file_0..file_K-1) per request
+        self.multi_file_urls: frozenset = frozenset(
+            url.strip() for url in os.getenv("HTTP_MULTI_FILE_URLS", "").split(",") if url.strip()
+        )
+        # Per-host request budgets, e.g. "api-inference.huggingface.co=10/1"
+        self.rate_limits: Dict[str, Tuple[float, float]] = _parse_rate_limits(
+            os.getenv("HTTP_RATE_LIMITS", "")
+        )
+
+
+class AgentSettings:
+    """ReAct agent settings."""
+    __slots__ = ("llm_router",)
+
+    def __init__(self) -> None:
+        # Let the LLM choose each step instead of following the fixed pipeline
+        self.llm_router: bool = os.getenv("REACT_LLM_ROUTER", "").lower() in ("1", "true", "yes")
 
 
-@dataclass(frozen=True)
 class Settings:
     """Main settings container."""
-    api: APIEndpoints = field(default_factory=APIEndpoints)
-    llm: LLMSettings = field(default_factory=LLMSettings)
-    processing: ProcessingSettings = field(default_factory=ProcessingSettings)
+    __slots__ = ("api", "llm", "processing", "http", "agent")
+
+    def __init__(self) -> None:
+        self.api = APIEndpoints()
+        self.llm = LLMSettings()
+        self.processing = ProcessingSettings()
+        self.http = HTTPSettings()
+        self.agent = AgentSettings()
 
 
 # Global settings instance
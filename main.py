@@ -4,9 +4,12 @@ Health Insurance Claim Processing System.
 API endpoint for processing claim files.
 """
 
+import asyncio
 import logging
 import os
-import tempfile
+import aiofiles.tempfile
+import orjson
+from typing import Any
 from fastapi import FastAPI, UploadFile, File
 from fastapi.responses import JSONResponse
 from dotenv import load_dotenv
@@ -19,7 +22,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Health Insurance Claim Processor")
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, without FastAPI's deprecated class."""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+app = FastAPI(
+    title="Health Insurance Claim Processor",
+    default_response_class=ORJSONResponse
+)
+
+# Uploads are copied to disk in chunks of this size to keep memory flat
+UPLOAD_CHUNK_SIZE = 1 << 20
 
 
 @app.post("/process-claim")
@@ -27,17 +43,20 @@ async def process_claim(files: list[UploadFile] = File(...)):
     """Process uploaded claim files and return decision."""
     from src.agent.react_agent import run_agent
     
-    # Save uploaded files temporarily
     temp_files = []
-    for file in files:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-            temp_file.write(await file.read())
-            temp_files.append(temp_file.name)
-    
     try:
-        # Run the agent
-        result = run_agent(temp_files)
-        return JSONResponse(content=result)
+        # Stream uploaded files to temporary files
+        for file in files:
+            async with aiofiles.tempfile.NamedTemporaryFile(
+                "wb", delete=False, suffix=".pdf"
+            ) as temp_file:
+                temp_files.append(temp_file.name)
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    await temp_file.write(chunk)
+        
+        # Run the agent off the event loop
+        result = await asyncio.to_thread(run_agent, temp_files)
+        return result
     finally:
         # Clean up temp files
         for temp_file in temp_files:
@@ -46,4 +65,12 @@ async def process_claim(files: list[UploadFile] = File(...)):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count(),
+        proxy_headers=True
+    )
\ No newline at end of file
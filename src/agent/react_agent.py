@@ -4,16 +4,21 @@ ReAct Agent with explicit Thought-Action-Observation loop.
 Implements the ReAct pattern: Reason → Act → Observe → Repeat
 """
 
-import json
 import logging
-from typing import TypedDict, Literal, Annotated
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, TypedDict, Literal, Annotated
 from operator import add
 
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
-from langgraph.graph import StateGraph, START, END
+import orjson
 
 from config.settings import settings
+from src.utils.llm import get_llm
+
+# LangChain/LangGraph are imported inside the functions that use them to keep
+# module import (and FastAPI worker startup) cheap.
+if TYPE_CHECKING:
+    from langgraph.graph.state import CompiledStateGraph
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +29,7 @@ logger = logging.getLogger(__name__)
 
 class AgentState(TypedDict):
     """State for the ReAct agent."""
-    messages: list                          # Conversation history
+    files: list[str]                        # Uploaded file paths
     current_step: str                       # Current pipeline step
     thought: str                            # Agent's reasoning
     action: str                             # Chosen action/tool
@@ -34,6 +39,7 @@ class AgentState(TypedDict):
     is_complete: bool                       # Termination flag
     final_result: dict                      # Final output
     claim_decision: dict                    # Store claim decision details
+    results: dict                           # Processor results by action
 
 
 # =============================================================================
@@ -52,71 +58,179 @@ Available Actions:
 7. finish - Complete processing and return final result
 
 For each step, you must respond in this exact JSON format:
-{{
+{
     "thought": "Your reasoning about what to do next",
     "action": "action_name",
-    "action_input": {{"param": "value"}}
-}}
+    "action_input": {"param": "value"}
+}
 
 Process claims sequentially: ingest → preprocess → extract → analyze → decide → output → finish
-
-Current files: {files}
-Current step: {step}
-Previous observation: {observation}
 """
 
+# Per-iteration context, sent separately so the static prompt above stays
+# byte-identical across calls (and eligible for provider-side prompt caching)
+CONTEXT_TEMPLATE = """Current files: {}
+Current step: {}
+Previous observation: {}
 
-# =============================================================================
-# TOOL IMPLEMENTATIONS
-# =============================================================================
+Iteration {}. What is your next action?"""
 
-def execute_action(action: str, action_input: dict, state: AgentState) -> str:
-    """Execute the chosen action and return observation."""
+
+@lru_cache(maxsize=1)
+def _system_message():
+    """Build the static system message once."""
+    from langchain_core.messages import SystemMessage
+    return SystemMessage(content=SYSTEM_PROMPT)
+
+
+# Markdown code fence (```json ... ``` or ``` ... ```) around the LLM's JSON
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.IGNORECASE | re.DOTALL)
+
+# Outermost {...} object, for replies with prose around the JSON
+_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+
+def _parse_llm_json(content: str) -> dict:
+    """
+    Parse the JSON object from an LLM reply.
     
-    files = action_input.get("files", [])
+    Accepts fenced or bare JSON, falling back to the outermost {...} span.
     
-    if action == "ingest":
-        from src.processors.ingestion import ingest_files
-        result = ingest_files(files)
-        return f"Ingested {len(result['documents'])} files successfully."
+    Args:
+        content: Raw LLM reply.
     
-    elif action == "preprocess":
-        from src.processors.preprocessing import preprocess_documents
-        result = preprocess_documents(files)
-        return f"Preprocessed documents. Stamps: {len(result['stamp_detections'])}, Signatures: {len(result['signature_verifications'])}"
+    Returns:
+        Parsed JSON object.
     
-    elif action == "extract":
-        from src.processors.extraction import extract_data
-        result = extract_data(files)
-        return f"Extracted text from {len(result['extracted_text'])} docs, tables from {len(result['extracted_tables'])} docs."
+    Raises:
+        orjson.JSONDecodeError: If no valid JSON object is found.
+    """
+    match = _FENCE_RE.search(content)
+    payload = match.group(1) if match else content
+    try:
+        return orjson.loads(payload)
+    except orjson.JSONDecodeError:
+        match = _OBJECT_RE.search(payload)
+        if not match:
+            raise
+        return orjson.loads(match.group(0))
+
+
+# =============================================================================
+# TOOL IMPLEMENTATIONS
+# =============================================================================
+
+def _ingest(action_input: dict, state: AgentState) -> str:
+    from src.processors.ingestion import ingest_files
+    result = ingest_files(action_input.get("files", []))
+    state["results"]["ingest"] = result
+    return f"Ingested {len(result['documents'])} files successfully."
+
+
+def _preprocess(action_input: dict, state: AgentState) -> str:
+    from src.processors.preprocessing import preprocess_documents_sync
+    result = preprocess_documents_sync(action_input.get("files", []))
+    state["results"]["preprocess"] = result
+    return f"Preprocessed documents. Stamps: {len(result['stamp_detections'])}, Signatures: {len(result['signature_verifications'])}"
+
+
+def _extract(action_input: dict, state: AgentState) -> str:
+    from src.processors.extraction import extract_data_sync
+    result = extract_data_sync(action_input.get("files", []))
+    state["results"]["extract"] = result
+    return f"Extracted text from {len(result['extracted_text'])} docs, tables from {len(result['extracted_tables'])} docs."
+
+
+def _analyze(action_input: dict, state: AgentState) -> str:
+    from src.processors.intelligence import analyze_intelligence_sync
+    texts = action_input.get("texts", [])
+    tables = action_input.get("tables", [])
+    result = analyze_intelligence_sync(texts, tables, action_input.get("files", []))
+    state["results"]["analyze"] = result
+    return f"Analysis complete. Entities: {len(result['entities'])}, Claim JSON structured."
+
+
+def _decide(action_input: dict, state: AgentState) -> str:
+    from src.processors.decision import make_decision
+    claim_json = action_input.get("claim_json", {})
+    result = make_decision(claim_json)
+    state["claim_decision"] = result  # Store decision in state
+    return f"Decision: {result['decision']}. Reasons: {result['reasons'][:100]}..."
+
+
+def _output(action_input: dict, state: AgentState) -> str:
+    from src.processors.output import generate_output
+    claim_data = action_input.get("claim_data", {})
+    decision = action_input.get("decision", "query")
+    reasons = action_input.get("reasons", "")
+    result = generate_output(claim_data, decision, reasons)
+    state["results"]["output"] = result
+    return f"Reports generated: {list(result['reports'].keys())}. Stored in DB: {result['stored_in_db']}"
+
+
+def _finish(action_input: dict, state: AgentState) -> str:
+    return "COMPLETE"
+
+
+# Action name -> handler(action_input, state) returning the observation
+_HANDLERS = {
+    "ingest": _ingest,
+    "preprocess": _preprocess,
+    "extract": _extract,
+    "analyze": _analyze,
+    "decide": _decide,
+    "output": _output,
+    "finish": _finish,
+}
+
+
+# Fixed processing order; each action runs once, in sequence
+_PIPELINE = ("ingest", "preprocess", "extract", "analyze", "decide", "output", "finish")
+
+_NEXT_ACTION = dict(zip(("start",) + _PIPELINE[:-1], _PIPELINE))
+
+
+def _build_input_for(action: str, state: AgentState) -> dict:
+    """
+    Build action parameters from the results of earlier steps.
+    
+    Args:
+        action: Action about to run.
+        state: Current agent state.
     
-    elif action == "analyze":
-        from src.processors.intelligence import analyze_intelligence
-        texts = action_input.get("texts", [])
-        tables = action_input.get("tables", [])
-        result = analyze_intelligence(texts, tables, files)
-        return f"Analysis complete. Entities: {len(result['entities'])}, Claim JSON structured."
+    Returns:
+        Default parameters for the action.
+    """
+    results = state["results"]
+    action_input = {"files": state["files"]}
+    
+    if action == "analyze":
+        extraction = results.get("extract", {})
+        action_input["texts"] = [
+            r["text"]
+            for r in extraction.get("extracted_text", [])
+            if isinstance(r, dict) and "text" in r
+        ]
+        action_input["tables"] = extraction.get("extracted_tables", [])
     
     elif action == "decide":
-        from src.processors.decision import make_decision
-        claim_json = action_input.get("claim_json", {})
-        result = make_decision(claim_json)
-        state["claim_decision"] = result  # Store decision in state
-        return f"Decision: {result['decision']}. Reasons: {result['reasons'][:100]}..."
+        structured = results.get("analyze", {}).get("claim_json", {})
+        action_input["claim_json"] = structured.get("claim_json", {})
     
     elif action == "output":
-        from src.processors.output import generate_output
-        claim_data = action_input.get("claim_data", {})
-        decision = action_input.get("decision", "query")
-        reasons = action_input.get("reasons", "")
-        result = generate_output(claim_data, decision, reasons)
-        return f"Reports generated: {list(result['reports'].keys())}. Stored in DB: {result['stored_in_db']}"
-    
-    elif action == "finish":
-        return "COMPLETE"
+        action_input["claim_data"] = results.get("analyze", {}).get("claim_json", {})
+        action_input["decision"] = state["claim_decision"].get("decision", "query")
+        action_input["reasons"] = state["claim_decision"].get("reasons", "")
     
-    else:
+    return action_input
+
+
+def execute_action(action: str, action_input: dict, state: AgentState) -> str:
+    """Execute the chosen action and return observation."""
+    handler = _HANDLERS.get(action)
+    if handler is None:
         return f"Unknown action: {action}"
+    return handler(action_input, state)
 
 
 # =============================================================================
@@ -126,47 +240,51 @@ def execute_action(action: str, action_input: dict, state: AgentState) -> str:
 def think_node(state: AgentState) -> AgentState:
     """
     THINK: Agent reasons about current state and decides next action.
+    
+    The pipeline order is fixed, so the next step is chosen without an LLM
+    call unless the LLM router is enabled in settings.
     """
-    llm = ChatGoogleGenerativeAI(
-        model=settings.llm.model,
-        temperature=settings.llm.temperature,
-        api_key=settings.llm.api_key
-    )
+    if settings.agent.llm_router:
+        return _llm_think(state)
+    
+    state["action"] = _NEXT_ACTION.get(state["current_step"], "finish")
+    state["action_input"] = {}
+    state["thought"] = f"Step '{state['current_step']}' done; next is '{state['action']}'."
+    
+    logger.info("THINK: %s", state["thought"])
+    return state
+
+
+def _llm_think(state: AgentState) -> AgentState:
+    """Let the LLM reason about the current state and pick the next action."""
+    from langchain_core.messages import HumanMessage
+    
+    llm = get_llm(settings.llm.model, settings.llm.temperature, settings.llm.api_key)
     
-    # Build prompt with current context
-    files = state.get("messages", [{}])[0].get("files", []) if state.get("messages") else []
-    prompt = SYSTEM_PROMPT.format(
-        files=files,
-        step=state.get("current_step", "start"),
-        observation=state.get("observation", "None yet")
+    # Only the current context changes between iterations
+    context = CONTEXT_TEMPLATE.format(
+        state["files"],
+        state.get("current_step", "start"),
+        state.get("observation", "None yet"),
+        state["iteration"]
     )
     
-    messages = [
-        SystemMessage(content=prompt),
-        HumanMessage(content=f"Iteration {state['iteration']}. What is your next action?")
-    ]
+    messages = [_system_message(), HumanMessage(content=context)]
     
     response = llm.invoke(messages)
     
     # Parse JSON response
     try:
-        content = response.content.strip()
-        # Extract JSON from response
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
-        
-        parsed = json.loads(content)
+        parsed = _parse_llm_json(response.content)
         
         state["thought"] = parsed.get("thought", "")
         state["action"] = parsed.get("action", "finish")
         state["action_input"] = parsed.get("action_input", {})
         
-        logger.info(f"THINK: {state['thought'][:200]}...")
+        logger.info("THINK: %.200s...", state["thought"])
         
-    except json.JSONDecodeError:
-        logger.warning(f"Failed to parse LLM response: {response.content}")
+    except orjson.JSONDecodeError:
+        logger.warning("Failed to parse LLM response: %s", response.content)
         state["thought"] = "Failed to parse response, finishing."
         state["action"] = "finish"
         state["action_input"] = {}
@@ -181,12 +299,11 @@ def act_node(state: AgentState) -> AgentState:
     action = state["action"]
     action_input = state["action_input"]
     
-    # Add files from initial message if not in action_input
-    if "files" not in action_input and state.get("messages"):
-        first_msg = state["messages"][0] if state["messages"] else {}
-        action_input["files"] = first_msg.get("files", [])
+    # Fill parameters the action did not specify from earlier results
+    for key, value in _build_input_for(action, state).items():
+        action_input.setdefault(key, value)
     
-    logger.info(f"ACT: {action} with {len(action_input.get('files', []))} files")
+    logger.info("ACT: %s with %d files", action, len(action_input.get("files", [])))
     
     observation = execute_action(action, action_input, state)
     state["observation"] = observation
@@ -201,7 +318,7 @@ def observe_node(state: AgentState) -> AgentState:
     """
     observation = state["observation"]
     
-    logger.info(f"OBSERVE: {observation[:100]}...")
+    logger.info("OBSERVE: %.100s...", observation)
     
     # Check if complete
     if observation == "COMPLETE" or state["action"] == "finish":
@@ -234,8 +351,9 @@ def should_continue(state: AgentState) -> Literal["think", "end"]:
 # BUILD GRAPH
 # =============================================================================
 
-def build_react_graph() -> StateGraph:
+def build_react_graph() -> "CompiledStateGraph":
     """Build the ReAct agent graph with Think → Act → Observe loop."""
+    from langgraph.graph import StateGraph, START, END
     
     graph = StateGraph(AgentState)
     
@@ -253,6 +371,17 @@ def build_react_graph() -> StateGraph:
     return graph.compile()
 
 
+@lru_cache(maxsize=1)
+def get_react_graph() -> "CompiledStateGraph":
+    """
+    Get the compiled ReAct graph, building it on first use.
+    
+    The compiled graph holds no per-claim state, so one instance is
+    shared by all runs.
+    """
+    return build_react_graph()
+
+
 # =============================================================================
 # PUBLIC API
 # =============================================================================
@@ -267,10 +396,10 @@ def run_agent(uploaded_files: list[str]) -> dict:
     Returns:
         Final processing result.
     """
-    agent = build_react_graph()
+    agent = get_react_graph()
     
     initial_state: AgentState = {
-        "messages": [{"files": uploaded_files}],
+        "files": uploaded_files,
         "current_step": "start",
         "thought": "",
         "action": "",
@@ -279,10 +408,11 @@ def run_agent(uploaded_files: list[str]) -> dict:
         "iteration": 0,
         "is_complete": False,
         "final_result": {},
-        "claim_decision": {}
+        "claim_decision": {},
+        "results": {}
     }
     
-    logger.info(f"Starting ReAct agent for {len(uploaded_files)} files")
+    logger.info("Starting ReAct agent for %d files", len(uploaded_files))
     
     result = agent.invoke(initial_state)
     
@@ -6,9 +6,8 @@ Makes approval/reject/query decisions based on claim data using LLM reasoning.
 
 import logging
 from typing import Dict, Any
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.messages import HumanMessage
 from config.settings import settings
+from src.utils.llm import get_llm
 
 logger = logging.getLogger(__name__)
 
@@ -60,16 +59,14 @@ def make_decision(claim_json: Dict[str, Any]) -> Dict[str, str]:
     Returns:
         Dict with decision and reasons.
     """
-    llm = ChatGoogleGenerativeAI(
-        model=settings.llm.model,
-        temperature=settings.llm.temperature,
-        api_key=settings.llm.api_key
-    )
+    from langchain_core.messages import HumanMessage
+    
+    llm = get_llm(settings.llm.model, settings.llm.temperature, settings.llm.api_key)
     
     prompt = DECISION_PROMPT.format(claim_data=claim_json)
     response = llm.invoke([HumanMessage(content=prompt)])
     
     decision, reasons = _parse_decision(response.content)
     
-    logger.info(f"Decision made: {decision}")
+    logger.info("Decision made: %s", decision)
     return {"decision": decision, "reasons": reasons}
@@ -4,9 +4,33 @@ Extraction Processor.
 Handles text extraction, table extraction, and translation.
 """
 
+import asyncio
 from typing import List, Dict, Any
 from config.settings import settings
-from src.utils.http_client import process_files_batch, process_texts_batch
+from src.types import as_dicts
+from src.utils.async_runner import run_sync
+from src.utils.http_client import (
+    process_files_batch,
+    process_texts_batch,
+    aprocess_files_batch,
+    aprocess_texts_batch,
+)
+
+
+def _page_range(start_page: int = None, end_page: int = None) -> Dict[str, str]:
+    """
+    Build page range form data, falling back to configured defaults.
+    
+    Args:
+        start_page: Start page number.
+        end_page: End page number.
+    
+    Returns:
+        Form data with start and end page.
+    """
+    start = start_page or settings.processing.default_start_page
+    end = end_page or settings.processing.default_end_page
+    return {'start_page': str(start), 'end_page': str(end)}
 
 
 def extract_text(
@@ -25,14 +49,11 @@ def extract_text(
     Returns:
         List of text extraction results.
     """
-    start = start_page or settings.processing.default_start_page
-    end = end_page or settings.processing.default_end_page
-    
-    return process_files_batch(
+    return as_dicts(process_files_batch(
         settings.api.extract_text,
         document_paths,
-        {'start_page': str(start), 'end_page': str(end)}
-    )
+        _page_range(start_page, end_page)
+    ))
 
 
 def extract_tables(
@@ -51,14 +72,11 @@ def extract_tables(
     Returns:
         List of table extraction results.
     """
-    start = start_page or settings.processing.default_start_page
-    end = end_page or settings.processing.default_end_page
-    
-    return process_files_batch(
+    return as_dicts(process_files_batch(
         settings.api.extract_tables,
         document_paths,
-        {'start_page': str(start), 'end_page': str(end)}
-    )
+        _page_range(start_page, end_page)
+    ))
 
 
 def translate_texts(
@@ -76,36 +94,92 @@ def translate_texts(
         List of translation results.
     """
     target = target_language or settings.processing.language
-    return process_texts_batch(
+    return as_dicts(process_texts_batch(
+        settings.api.translate,
+        texts,
+        {'target_language': target}
+    ))
+
+
+async def aextract_text(
+    document_paths: List[str],
+    start_page: int = None,
+    end_page: int = None
+) -> List[Dict[str, Any]]:
+    """Async variant of extract_text."""
+    return as_dicts(await aprocess_files_batch(
+        settings.api.extract_text,
+        document_paths,
+        _page_range(start_page, end_page)
+    ))
+
+
+async def aextract_tables(
+    document_paths: List[str],
+    start_page: int = None,
+    end_page: int = None
+) -> List[Dict[str, Any]]:
+    """Async variant of extract_tables."""
+    return as_dicts(await aprocess_files_batch(
+        settings.api.extract_tables,
+        document_paths,
+        _page_range(start_page, end_page)
+    ))
+
+
+async def atranslate_texts(
+    texts: List[str],
+    target_language: str = None
+) -> List[Dict[str, Any]]:
+    """Async variant of translate_texts."""
+    target = target_language or settings.processing.language
+    return as_dicts(await aprocess_texts_batch(
         settings.api.translate,
         texts,
         {'target_language': target}
-    )
+    ))
 
 
-def extract_data(documents: List[str]) -> Dict[str, Any]:
+async def extract_data(documents: List[str]) -> Dict[str, Any]:
     """
     Run full extraction pipeline on documents.
     
+    Table extraction runs concurrently with text extraction and
+    translation, since tables do not depend on the extracted text.
+    
     Args:
         documents: List of document paths.
     
     Returns:
         Dict with all extraction results.
     """
-    text_results = extract_text(documents)
-    table_results = extract_tables(documents)
+    tables_task = asyncio.create_task(aextract_tables(documents))
+    text_results = await aextract_text(documents)
     
     # Extract raw text for translation
     raw_texts = [
-        r.get("text", "") 
-        for r in text_results 
+        r.get("text", "")
+        for r in text_results
         if isinstance(r, dict) and "text" in r
     ]
-    translation_results = translate_texts(raw_texts) if raw_texts else []
+    translation_results = await atranslate_texts(raw_texts) if raw_texts else []
+    table_results = await tables_task
     
     return {
         "extracted_text": text_results,
         "extracted_tables": table_results,
         "translated_text": translation_results
     }
+
+
+def extract_data_sync(documents: List[str]) -> Dict[str, Any]:
+    """
+    Run the extraction pipeline from synchronous code.
+    
+    Args:
+        documents: List of document paths.
+    
+    Returns:
+        Dict with all extraction results.
+    """
+    return run_sync(extract_data(documents))
@@ -4,9 +4,18 @@ Intelligence Processor.
 Handles NER, classification, JSON structuring, and summarization.
 """
 
-from typing import List, Dict, Any, Optional
+import asyncio
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from config.settings import settings
-from src.utils.http_client import process_files_batch, process_texts_batch
+from src.types import as_dicts
+from src.utils.async_runner import run_sync
+from src.utils.http_client import (
+    process_files_batch,
+    process_texts_batch,
+    aprocess_files_batch,
+    aprocess_texts_batch,
+)
 
 
 def extract_entities(
@@ -24,9 +33,9 @@ def extract_entities(
         List of NER results.
     """
     if texts:
-        return process_texts_batch(settings.api.ner, texts)
+        return as_dicts(process_texts_batch(settings.api.ner, texts))
     if document_paths:
-        return process_files_batch(settings.api.ner, document_paths)
+        return as_dicts(process_files_batch(settings.api.ner, document_paths))
     return [{"error": "No input provided"}]
 
 
@@ -45,9 +54,9 @@ def classify_documents(
         List of classification results.
     """
     if texts:
-        return process_texts_batch(settings.api.classify, texts)
+        return as_dicts(process_texts_batch(settings.api.classify, texts))
     if document_paths:
-        return process_files_batch(settings.api.classify, document_paths)
+        return as_dicts(process_files_batch(settings.api.classify, document_paths))
     return [{"error": "No input provided"}]
 
 
@@ -72,12 +81,46 @@ def summarize(
     extra_data = {'start_page': str(start_page), 'end_page': str(end_page)}
     
     if texts:
-        return process_texts_batch(settings.api.summarize, texts, extra_data)
+        return as_dicts(process_texts_batch(settings.api.summarize, texts, extra_data))
     if document_paths:
-        return process_files_batch(settings.api.summarize, document_paths, extra_data)
+        return as_dicts(process_files_batch(settings.api.summarize, document_paths, extra_data))
     return [{"error": "No input provided"}]
 
 
+# Entity label keywords -> (claim section, key), in match priority order.
+# A key of None means the section is a list and the entity text is appended.
+_LABEL_RULES = (
+    (("PATIENT",), ("patient", "name")),
+    (("PROVIDER", "HOSPITAL"), ("provider", "name")),
+    (("POLICY",), ("policy", "number")),
+    (("DIAGNOSIS",), ("diagnosis", None)),
+    (("PROCEDURE",), ("procedures", None)),
+    (("AMOUNT", "COST"), ("amounts", "total")),
+    (("DATE",), ("dates", "claim_date")),
+)
+
+
+@lru_cache(maxsize=256)
+def _label_target(label: str) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Map an NER label to its claim section and key.
+    
+    NER label vocabularies are small, so results are memoised and each
+    entity after the first with a given label costs one dict lookup.
+    
+    Args:
+        label: Entity label as returned by the NER endpoint.
+    
+    Returns:
+        (section, key) of the first matching rule, or None.
+    """
+    upper = label.upper()
+    for keywords, target in _LABEL_RULES:
+        if any(keyword in upper for keyword in keywords):
+            return target
+    return None
+
+
 def structure_claim_json(
     entities: List[Dict[str, Any]],
     tables: List[Dict[str, Any]]
@@ -109,28 +152,61 @@ def structure_claim_json(
             continue
             
         for entity in entity_group.get("entities", []):
-            label = entity.get("label", "").upper()
-            text = entity.get("text", "")
+            target = _label_target(entity.get("label", ""))
+            if target is None:
+                continue
             
-            if "PATIENT" in label:
-                claim["patient"]["name"] = text
-            elif "PROVIDER" in label or "HOSPITAL" in label:
-                claim["provider"]["name"] = text
-            elif "POLICY" in label:
-                claim["policy"]["number"] = text
-            elif "DIAGNOSIS" in label:
-                claim["diagnosis"].append(text)
-            elif "PROCEDURE" in label:
-                claim["procedures"].append(text)
-            elif "AMOUNT" in label or "COST" in label:
-                claim["amounts"]["total"] = text
-            elif "DATE" in label:
-                claim["dates"]["claim_date"] = text
+            section, key = target
+            text = entity.get("text", "")
+            if key is None:
+                claim[section].append(text)
+            else:
+                claim[section][key] = text
     
     return {"claim_json": claim, "raw_entities": entities, "raw_tables": tables}
 
 
-def analyze_intelligence(
+async def aextract_entities(
+    texts: Optional[List[str]] = None,
+    document_paths: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    """Async variant of extract_entities."""
+    if texts:
+        return as_dicts(await aprocess_texts_batch(settings.api.ner, texts))
+    if document_paths:
+        return as_dicts(await aprocess_files_batch(settings.api.ner, document_paths))
+    return [{"error": "No input provided"}]
+
+
+async def aclassify_documents(
+    texts: Optional[List[str]] = None,
+    document_paths: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    """Async variant of classify_documents."""
+    if texts:
+        return as_dicts(await aprocess_texts_batch(settings.api.classify, texts))
+    if document_paths:
+        return as_dicts(await aprocess_files_batch(settings.api.classify, document_paths))
+    return [{"error": "No input provided"}]
+
+
+async def asummarize(
+    texts: Optional[List[str]] = None,
+    document_paths: Optional[List[str]] = None,
+    start_page: int = 1,
+    end_page: int = 1
+) -> List[Dict[str, Any]]:
+    """Async variant of summarize."""
+    extra_data = {'start_page': str(start_page), 'end_page': str(end_page)}
+    
+    if texts:
+        return as_dicts(await aprocess_texts_batch(settings.api.summarize, texts, extra_data))
+    if document_paths:
+        return as_dicts(await aprocess_files_batch(settings.api.summarize, document_paths, extra_data))
+    return [{"error": "No input provided"}]
+
+
+async def analyze_intelligence(
     extracted_texts: List[str],
     extracted_tables: List[Dict[str, Any]],
     documents: Optional[List[str]] = None
@@ -138,6 +214,9 @@ def analyze_intelligence(
     """
     Run full intelligence analysis pipeline.
     
+    NER, classification, and summarization are independent calls on the
+    same texts, so they are dispatched concurrently.
+    
     Args:
         extracted_texts: List of extracted text strings.
         extracted_tables: List of extracted tables.
@@ -146,10 +225,12 @@ def analyze_intelligence(
     Returns:
         Dict with all intelligence results.
     """
-    entities = extract_entities(texts=extracted_texts)
-    classifications = classify_documents(texts=extracted_texts)
+    entities, classifications, summaries = await asyncio.gather(
+        aextract_entities(texts=extracted_texts),
+        aclassify_documents(texts=extracted_texts),
+        asummarize(texts=extracted_texts)
+    )
     claim_json = structure_claim_json(entities, extracted_tables)
-    summaries = summarize(texts=extracted_texts)
     
     return {
         "entities": entities,
@@ -157,3 +238,22 @@ def analyze_intelligence(
         "claim_json": claim_json,
         "summaries": summaries
     }
+
+
+def analyze_intelligence_sync(
+    extracted_texts: List[str],
+    extracted_tables: List[Dict[str, Any]],
+    documents: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Run the intelligence pipeline from synchronous code.
+    
+    Args:
+        extracted_texts: List of extracted text strings.
+        extracted_tables: List of extracted tables.
+        documents: Optional document paths.
+    
+    Returns:
+        Dict with all intelligence results.
+    """
+    return run_sync(analyze_intelligence(extracted_texts, extracted_tables, documents))
@@ -5,8 +5,8 @@ Handles report generation and database storage.
 """
 
 import os
-import json
 import logging
+import orjson
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
@@ -15,6 +15,16 @@ logger = logging.getLogger(__name__)
 
 REPORTS_DIR = Path("reports")
 
+_reports_dir_ready = False
+
+
+def _ensure_reports_dir() -> None:
+    """Create the reports directory on first use only."""
+    global _reports_dir_ready
+    if not _reports_dir_ready:
+        REPORTS_DIR.mkdir(exist_ok=True)
+        _reports_dir_ready = True
+
 
 def generate_report(
     claim_data: Dict[str, Any],
@@ -32,35 +42,43 @@ def generate_report(
     Returns:
         Dict with paths to generated report files.
     """
-    REPORTS_DIR.mkdir(exist_ok=True)
+    _ensure_reports_dir()
     
     claim_id = claim_data.get("claim_id", "unknown")
     timestamp = datetime.now().isoformat()
     
+    # Serialize claim details once; both reports embed the same bytes
+    details_blob = orjson.dumps(
+        claim_data.get("claim_json", claim_data),
+        option=orjson.OPT_INDENT_2
+    )
+    
     report_data = {
         "claim_id": claim_id,
         "decision": decision,
         "reasons": reasons,
-        "claim_details": claim_data.get("claim_json", claim_data),
+        # Fragments are inserted verbatim, so indent the blob to its depth
+        "claim_details": orjson.Fragment(details_blob.replace(b"\n", b"\n  ")),
         "timestamp": timestamp
     }
     
     # Generate JSON report
     json_path = REPORTS_DIR / f"report_{claim_id}.json"
-    with open(json_path, 'w') as f:
-        json.dump(report_data, f, indent=2)
+    json_path.write_bytes(orjson.dumps(report_data, option=orjson.OPT_INDENT_2))
     
     # Generate PDF placeholder (implement with reportlab for production)
     pdf_path = REPORTS_DIR / f"report_{claim_id}.pdf"
-    with open(pdf_path, 'w') as f:
-        f.write(f"ADJUDICATION REPORT\n{'='*40}\n")
-        f.write(f"Claim ID: {claim_id}\n")
-        f.write(f"Decision: {decision}\n")
-        f.write(f"Timestamp: {timestamp}\n\n")
-        f.write(f"Reasons:\n{reasons}\n\n")
-        f.write(f"Details:\n{json.dumps(report_data['claim_details'], indent=2)}")
+    header = (
+        f"ADJUDICATION REPORT\n{'='*40}\n"
+        f"Claim ID: {claim_id}\n"
+        f"Decision: {decision}\n"
+        f"Timestamp: {timestamp}\n\n"
+        f"Reasons:\n{reasons}\n\n"
+        f"Details:\n"
+    )
+    pdf_path.write_bytes(header.encode() + details_blob)
     
-    logger.info(f"Generated reports for claim {claim_id}")
+    logger.info("Generated reports for claim %s", claim_id)
     return {"json_report": str(json_path), "pdf_report": str(pdf_path)}
 
 
@@ -75,7 +93,7 @@ def store_to_database(data: Dict[str, Any]) -> bool:
         True if storage successful.
     """
     # Placeholder: implement with SQLAlchemy for production
-    logger.info(f"Storing claim data to database: {data.get('claim_id', 'unknown')}")
+    logger.info("Storing claim data to database: %s", data.get("claim_id", "unknown"))
     return True
 
 
@@ -4,12 +4,15 @@ Preprocessing Processor.
 Handles document splitting, image description, stamp detection, and signature verification.
 """
 
-from typing import List, Dict, Any
+import asyncio
+from typing import List, Dict, Any, Optional
 from config.settings import settings
-from src.utils.http_client import process_files_batch
+from src.types import ProcessedDocument, as_dicts
+from src.utils.async_runner import run_sync
+from src.utils.http_client import process_files_batch, aprocess_files_batch
 
 
-def split_documents(documents: List[str]) -> List[Dict[str, Any]]:
+def split_documents(documents: List[str]) -> List[ProcessedDocument]:
     """
     Split multi-page documents by type.
     
@@ -19,36 +22,52 @@ def split_documents(documents: List[str]) -> List[Dict[str, Any]]:
     Returns:
         List of document metadata with type classification.
     """
-    return [{"type": "unknown", "path": doc} for doc in documents]
+    return [ProcessedDocument(path=doc) for doc in documents]
 
 
-def describe_images(
-    document_paths: List[str],
+def _optional_page_range(
     start_page: int = None,
     end_page: int = None
-) -> List[Dict[str, Any]]:
+) -> Optional[Dict[str, str]]:
     """
-    Generate image descriptions from PDFs using HF API.
+    Build page range form data, omitting unset bounds.
     
     Args:
-        document_paths: List of PDF paths.
         start_page: Optional start page.
         end_page: Optional end page.
     
     Returns:
-        List of image description results.
+        Form data dict, or None if no bounds were given.
     """
     extra_data = {}
     if start_page is not None:
         extra_data['start_page'] = str(start_page)
     if end_page is not None:
         extra_data['end_page'] = str(end_page)
+    return extra_data or None
+
+
+def describe_images(
+    document_paths: List[str],
+    start_page: int = None,
+    end_page: int = None
+) -> List[Dict[str, Any]]:
+    """
+    Generate image descriptions from PDFs using HF API.
+    
+    Args:
+        document_paths: List of PDF paths.
+        start_page: Optional start page.
+        end_page: Optional end page.
     
-    return process_files_batch(
+    Returns:
+        List of image description results.
+    """
+    return as_dicts(process_files_batch(
         settings.api.describe_image,
         document_paths,
-        extra_data or None
-    )
+        _optional_page_range(start_page, end_page)
+    ))
 
 
 def detect_stamps(document_paths: List[str]) -> List[Dict[str, Any]]:
@@ -61,7 +80,7 @@ def detect_stamps(document_paths: List[str]) -> List[Dict[str, Any]]:
     Returns:
         List of stamp detection results.
     """
-    return process_files_batch(settings.api.stamp, document_paths)
+    return as_dicts(process_files_batch(settings.api.stamp, document_paths))
 
 
 def verify_signatures(document_paths: List[str]) -> List[Dict[str, Any]]:
@@ -74,22 +93,67 @@ def verify_signatures(document_paths: List[str]) -> List[Dict[str, Any]]:
     Returns:
         List of signature verification results.
     """
-    return process_files_batch(settings.api.signature, document_paths)
+    return as_dicts(process_files_batch(settings.api.signature, document_paths))
 
 
-def preprocess_documents(documents: List[str]) -> Dict[str, Any]:
+async def adescribe_images(
+    document_paths: List[str],
+    start_page: int = None,
+    end_page: int = None
+) -> List[Dict[str, Any]]:
+    """Async variant of describe_images."""
+    return as_dicts(await aprocess_files_batch(
+        settings.api.describe_image,
+        document_paths,
+        _optional_page_range(start_page, end_page)
+    ))
+
+
+async def adetect_stamps(document_paths: List[str]) -> List[Dict[str, Any]]:
+    """Async variant of detect_stamps."""
+    return as_dicts(await aprocess_files_batch(settings.api.stamp, document_paths))
+
+
+async def averify_signatures(document_paths: List[str]) -> List[Dict[str, Any]]:
+    """Async variant of verify_signatures."""
+    return as_dicts(await aprocess_files_batch(settings.api.signature, document_paths))
+
+
+async def preprocess_documents(documents: List[str]) -> Dict[str, Any]:
     """
     Run full preprocessing pipeline on documents.
     
+    The image, stamp, and signature endpoints are independent, so all
+    three batches are dispatched concurrently.
+    
     Args:
         documents: List of document paths.
     
     Returns:
         Dict with all preprocessing results.
     """
+    descriptions, stamps, signatures = await asyncio.gather(
+        adescribe_images(documents),
+        adetect_stamps(documents),
+        averify_signatures(documents)
+    )
+    
     return {
         "processed_documents": split_documents(documents),
-        "image_descriptions": describe_images(documents),
-        "stamp_detections": detect_stamps(documents),
-        "signature_verifications": verify_signatures(documents)
+        "image_descriptions": descriptions,
+        "stamp_detections": stamps,
+        "signature_verifications": signatures
     }
+
+
+def preprocess_documents_sync(documents: List[str]) -> Dict[str, Any]:
+    """
+    Run the preprocessing pipeline from synchronous code.
+    
+    Args:
+        documents: List of document paths.
+    
+    Returns:
+        Dict with all preprocessing results.
+    """
+    return run_sync(preprocess_documents(documents))
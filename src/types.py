@@ -2,7 +2,15 @@
 Shared type definitions for the claim processing system.
 """
 
-from typing import TypedDict, List, Dict, Any, Optional
+from dataclasses import dataclass
+from typing import TypedDict, NamedTuple, List, Dict, Any, Optional
+
+
+@dataclass(slots=True, frozen=True)
+class ProcessedDocument:
+    """An uploaded document and its detected type."""
+    path: str
+    type: str = "unknown"
 
 
 class ClaimState(TypedDict, total=False):
@@ -15,7 +23,7 @@ class ClaimState(TypedDict, total=False):
     uploaded_files: List[str]
     
     # Preprocessing results
-    processed_documents: List[Dict[str, Any]]
+    processed_documents: List[ProcessedDocument]
     image_descriptions: List[Dict[str, Any]]
     stamp_detections: List[Dict[str, Any]]
     signature_verifications: List[Dict[str, Any]]
@@ -40,8 +48,26 @@ class ClaimState(TypedDict, total=False):
     stored_in_db: bool
 
 
-class ProcessingResult(TypedDict):
+class ProcessingResult(NamedTuple):
     """Standard result format for processor operations."""
     success: bool
     data: Any
-    error: Optional[str]
+    error: Optional[str] = None
+
+
+def as_dict(result: ProcessingResult) -> Any:
+    """
+    Convert a result to the legacy response-or-error form.
+    
+    Args:
+        result: Result of an API call.
+    
+    Returns:
+        The decoded response on success, else {"error": message}.
+    """
+    return result.data if result.success else {"error": result.error}
+
+
+def as_dicts(results: List[ProcessingResult]) -> List[Any]:
+    """Convert a batch of results with as_dict."""
+    return [as_dict(result) for result in results]
@@ -0,0 +1,50 @@
+"""
+Async execution utilities.
+
+Runs coroutines from synchronous code on a shared background event loop.
+"""
+
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the background event loop, starting it on first use.
+    
+    Returns:
+        Event loop running in a daemon thread.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=_loop.run_forever,
+                name="async-runner",
+                daemon=True
+            )
+            thread.start()
+    return _loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion and return its result.
+    
+    Safe to call from inside a running event loop (e.g. a FastAPI
+    request handler), unlike asyncio.run.
+    
+    Args:
+        coro: Coroutine to execute.
+    
+    Returns:
+        Coroutine result.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
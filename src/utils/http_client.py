@@ -2,19 +2,812 @@
 HTTP client utilities for external API calls.
 """
 
+import asyncio
+import gzip
+import hashlib
 import logging
-import requests
+import mmap
+import os
+import random
+import re
+import threading
+import time
+import weakref
+import aiomultiprocess
+import httpx
+import orjson
+import psutil
+import zstandard
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from email.utils import parsedate_to_datetime
+from functools import partial
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from urllib.parse import urlencode
+from typing import (
+    Dict, Any, Optional, List, Tuple, Awaitable, Iterable, TypeVar,
+    BinaryIO, Mapping, NamedTuple, AsyncIterator, Set
+)
+
+from config.settings import settings
+from src.types import ProcessingResult
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+_POOL_SIZE = 32
+
+# Connection limits shared by the sync and async clients
+_LIMITS = httpx.Limits(max_connections=_POOL_SIZE * 2, max_keepalive_connections=_POOL_SIZE)
+
+# Transient failures worth retrying with exponential backoff and jitter
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_ERRORS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+_MAX_RETRIES = 5
+_BACKOFF_FACTOR = 0.5
+_BACKOFF_JITTER = 0.3
+_BACKOFF_MAX = 10.0
+_RETRY_AFTER_MAX = 60.0
+
+# Shared sync client: keep-alive pooling, and HTTP/2 so concurrent batch
+# requests to one host multiplex on a single connection
+_client = httpx.Client(
+    timeout=60,
+    transport=httpx.HTTPTransport(http2=True, limits=_LIMITS)
+)
+
+# Worker threads for sync batches; the client releases the GIL on socket I/O
+_pool = ThreadPoolExecutor(
+    max_workers=settings.http.pool_workers,
+    thread_name_prefix="http-batch"
+)
+
+# One async client per event loop; clients cannot be shared across loops
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def close_session() -> None:
+    """
+    Release all pooled connections and worker threads at shutdown.
+    
+    Closes the sync client, waits for the batch thread pool to finish,
+    and closes the async client of every event loop that is still open.
+    Clients on running loops are closed on their own loop, so this must
+    be called from synchronous code, not from inside an event loop.
+    
+    Raises:
+        RuntimeError: If called from a thread running an event loop.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError("close_session() cannot be called from a running event loop")
+    
+    _client.close()
+    _pool.shutdown(wait=True)
+    for loop, client in list(_async_clients.items()):
+        if loop.is_closed():
+            continue
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+        else:
+            loop.run_until_complete(client.aclose())
+    _async_clients.clear()
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Get the shared async HTTP client for the running event loop.
+    
+    Returns:
+        Async client reused across all calls on this loop.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            timeout=60,
+            transport=httpx.AsyncHTTPTransport(http2=True, limits=_LIMITS)
+        )
+        _async_clients[loop] = client
+    return client
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket allowing `rate` requests per `period` seconds.
+    
+    Callers reserve a token and then sleep for the returned delay, so one
+    bucket paces sync worker threads and every event loop alike.
+    """
+    
+    def __init__(self, rate: float, period: float = 1.0) -> None:
+        self.rate = rate
+        self.period = period
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """Take a token, returning how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            refill = (now - self._updated) * self.rate / self.period
+            self._tokens = min(self.rate, self._tokens + refill) - 1
+            self._updated = now
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens * self.period / self.rate
+
+
+# Request budgets per destination host; hosts without an entry are not limited
+_limiters: Dict[str, _TokenBucket] = {
+    host: _TokenBucket(rate, period)
+    for host, (rate, period) in settings.http.rate_limits.items()
+}
+
+
+def override_limit(host: str, rate: Optional[float], period: float = 1.0) -> None:
+    """
+    Replace the request budget for a host at runtime.
+    
+    Args:
+        host: Destination host name, as in the request URL.
+        rate: Requests allowed per period, or None to remove the limit.
+        period: Window length in seconds.
+    
+    Raises:
+        ValueError: If rate or period is not positive.
+    """
+    if rate is None:
+        _limiters.pop(host, None)
+        return
+    if rate <= 0 or period <= 0:
+        raise ValueError(f"Rate limit for {host} must be positive, got {rate}/{period}")
+    _limiters[host] = _TokenBucket(rate, period)
+
+
+def _rate_limit_delay(url: str) -> float:
+    """Reserve a request slot for the url's host, returning the wait in seconds."""
+    if not _limiters:
+        return 0.0
+    limiter = _limiters.get(httpx.URL(url).host)
+    return limiter.reserve() if limiter is not None else 0.0
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """
+    Compute the wait before the next attempt.
+    
+    Honours a Retry-After header (seconds or HTTP date) when the server
+    sends one, otherwise backs off exponentially with random jitter so
+    concurrent batch requests do not retry in lockstep.
+    
+    Args:
+        attempt: Zero-based number of the failed attempt.
+        response: Failed response, if the server replied.
+    
+    Returns:
+        Delay in seconds.
+    """
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                delay = None
+        if delay is not None:
+            return min(max(delay, 0.0), _RETRY_AFTER_MAX)
+    backoff = min(_BACKOFF_FACTOR * 2 ** attempt, _BACKOFF_MAX)
+    return backoff + random.uniform(0, _BACKOFF_JITTER)
+
+
+def _log_retry(url: str, reason: Any, attempt: int, delay: float) -> None:
+    """Log a retry so backoff storms show up in the logs."""
+    logger.warning(
+        "Retrying %s after %s (retry %d/%d, waiting %.2fs)",
+        url, reason, attempt + 1, _MAX_RETRIES, delay
+    )
+
+
+def _post(url: str, rewind: Optional[BinaryIO] = None, **kwargs: Any) -> httpx.Response:
+    """
+    POST with the shared client, retrying transient failures with backoff.
+    
+    Every attempt first waits for the destination host's rate limit.
+    
+    Args:
+        url: API endpoint URL.
+        rewind: File in the request body, rewound before each attempt.
+        **kwargs: Passed to httpx.Client.post.
+    
+    Returns:
+        Final response.
+    
+    Raises:
+        httpx.HTTPError: If the last attempt fails without a response.
+    """
+    for attempt in range(_MAX_RETRIES + 1):
+        if rewind is not None:
+            rewind.seek(0)
+        if delay := _rate_limit_delay(url):
+            time.sleep(delay)
+        try:
+            response = _client.post(url, **kwargs)
+        except _RETRY_ERRORS as e:
+            if attempt == _MAX_RETRIES:
+                raise
+            delay = _retry_delay(attempt)
+            _log_retry(url, type(e).__name__, attempt, delay)
+        else:
+            if response.status_code not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+                return response
+            delay = _retry_delay(attempt, response)
+            _log_retry(url, response.status_code, attempt, delay)
+        time.sleep(delay)
+
+
+async def _apost(url: str, rewind: Optional[BinaryIO] = None, **kwargs: Any) -> httpx.Response:
+    """Async variant of _post."""
+    for attempt in range(_MAX_RETRIES + 1):
+        if rewind is not None:
+            rewind.seek(0)
+        if delay := _rate_limit_delay(url):
+            await asyncio.sleep(delay)
+        try:
+            response = await get_async_client().post(url, **kwargs)
+        except _RETRY_ERRORS as e:
+            if attempt == _MAX_RETRIES:
+                raise
+            delay = _retry_delay(attempt)
+            _log_retry(url, type(e).__name__, attempt, delay)
+        else:
+            if response.status_code not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+                return response
+            delay = _retry_delay(attempt, response)
+            _log_retry(url, response.status_code, attempt, delay)
+        await asyncio.sleep(delay)
+
+
+_FORM_CONTENT_TYPE = "application/x-www-form-urlencoded"
+_JSON_CONTENT_TYPE = "application/json"
+
+# Text bodies smaller than this are sent uncompressed
+_COMPRESS_MIN_BYTES = 4096
+
+# Replies meaning the server could not read a compressed body; servers that
+# ignore Content-Encoding fail validation with 422 instead of answering 415
+_CODING_REJECTED_STATUSES = frozenset({400, 415, 422})
+
+# Request coding per host, learned when a server rejects a compressed body
+_host_codings: Dict[str, str] = {}
+
+
+def _compress(body: bytes, coding: str) -> bytes:
+    """
+    Compress a request body with the given content coding.
+    
+    Args:
+        body: Raw request body.
+        coding: "zstd" or "gzip".
+    
+    Returns:
+        Compressed body.
+    """
+    if coding == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(body)
+    return gzip.compress(body, compresslevel=6)
+
+
+def _request_coding(url: str, body: bytes) -> str:
+    """
+    Pick the content coding for a request body.
+    
+    Args:
+        url: API endpoint URL.
+        body: Raw request body.
+    
+    Returns:
+        Content coding, or an empty string to send the body as is.
+    """
+    if len(body) < _COMPRESS_MIN_BYTES:
+        return ""
+    return _host_codings.get(httpx.URL(url).host, settings.http.request_compression)
+
+
+def _fallback_coding(url: str, coding: str, response: httpx.Response) -> Optional[str]:
+    """
+    Decide whether to resend a compressed body after the server's response.
+    
+    A 400, 415, or 422 means the server could not read the body. Per RFC 7694
+    it may list the codings it does accept in Accept-Encoding, so zstd
+    falls back to gzip when offered and otherwise to no compression.
+    The choice is remembered for the host.
+    
+    Args:
+        url: API endpoint URL.
+        coding: Coding the request was sent with.
+        response: Server response.
+    
+    Returns:
+        Coding to resend with, or None to keep the response.
+    """
+    if not coding or response.status_code not in _CODING_REJECTED_STATUSES:
+        return None
+    accepted = response.headers.get("Accept-Encoding", "").lower()
+    fallback = "gzip" if coding != "gzip" and "gzip" in accepted else ""
+    host = httpx.URL(url).host
+    _host_codings[host] = fallback
+    logger.info("%s rejected %s request body, retrying with %s", host, coding, fallback or "identity")
+    return fallback
+
+
+def _encode_request(body: bytes, content_type: str, coding: str) -> Dict[str, Any]:
+    """
+    Build httpx request arguments for a body in the given coding.
+    
+    Args:
+        body: Raw request body.
+        content_type: Media type of the raw body.
+        coding: Content coding, or an empty string for none.
+    
+    Returns:
+        Keyword arguments for _post.
+    """
+    headers = {"Content-Type": content_type}
+    if coding:
+        headers["Content-Encoding"] = coding
+        body = _compress(body, coding)
+    return {"content": body, "headers": headers}
+
+
+def _post_body(url: str, body: bytes, content_type: str) -> httpx.Response:
+    """
+    POST a raw body, compressing it when large enough.
+    
+    Args:
+        url: API endpoint URL.
+        body: Raw request body.
+        content_type: Media type of the body.
+    
+    Returns:
+        Final response.
+    """
+    coding = _request_coding(url, body)
+    while True:
+        response = _post(url, **_encode_request(body, content_type, coding))
+        coding = _fallback_coding(url, coding, response)
+        if coding is None:
+            return response
+
+
+async def _apost_body(url: str, body: bytes, content_type: str) -> httpx.Response:
+    """Async variant of _post_body."""
+    coding = _request_coding(url, body)
+    while True:
+        response = await _apost(url, **_encode_request(body, content_type, coding))
+        coding = _fallback_coding(url, coding, response)
+        if coding is None:
+            return response
+
+
+class _LRUCache:
+    """Thread-safe bounded mapping that evicts the least recently used key."""
+    
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._data: "OrderedDict[Any, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+    
+    def put(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+    
+    def pop(self, key: Any) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+
+class _CachedResponse(NamedTuple):
+    """A cached response body with its HTTP validators."""
+    body: Dict[str, Any]
+    etag: Optional[str]
+    expires: Optional[float]  # time.monotonic() deadline; None = never stale
+    max_age: Optional[int]  # freshness lifetime in seconds; None = never stale
+    
+    def is_fresh(self) -> bool:
+        return self.expires is None or time.monotonic() < self.expires
+
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+# File upload responses keyed by (url, file name, content hash, form data),
+# so re-sending identical bytes to the same endpoint skips the round trip
+_response_cache = _LRUCache(maxsize=1024)
+
+# Content digests keyed by (path, size, mtime_ns)
+_digest_cache = _LRUCache(maxsize=1024)
+
+# Files at least this large are hashed through mmap
+_MMAP_MIN_BYTES = 16 << 20
+
+
+def _file_digest(f: BinaryIO, file_path: str) -> str:
+    """
+    Hash an open file, then rewind it for upload.
+    
+    Digests are memoised per (path, size, mtime), so unchanged files are
+    only read once. Large files are hashed straight from a memory map
+    instead of being copied into Python bytes chunk by chunk, and are
+    flagged for sequential readahead ahead of the upload.
+    
+    Args:
+        f: File opened in binary mode, positioned at the start.
+        file_path: Path the file was opened from.
+    
+    Returns:
+        Hex digest of the file contents.
+    """
+    fd = f.fileno()
+    stat = os.fstat(fd)
+    large = stat.st_size >= _MMAP_MIN_BYTES
+    if large and hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    
+    memo_key = (file_path, stat.st_size, stat.st_mtime_ns)
+    digest = _digest_cache.get(memo_key)
+    if digest is None:
+        hasher = hashlib.blake2b(digest_size=16)
+        if large:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                hasher.update(mapped)
+        else:
+            while chunk := f.read(1 << 16):
+                hasher.update(chunk)
+            f.seek(0)
+        digest = hasher.hexdigest()
+        _digest_cache.put(memo_key, digest)
+    return digest
+
+
+def _file_cache_key(
+    url: str,
+    f: BinaryIO,
+    file_path: str,
+    extra_data: Optional[Dict[str, str]]
+) -> Tuple:
+    """Build the response cache key for a file upload."""
+    return (
+        url,
+        Path(file_path).name,
+        _file_digest(f, file_path),
+        frozenset((extra_data or {}).items())
+    )
+
+
+def _conditional_headers(cached: Optional[_CachedResponse]) -> Dict[str, str]:
+    """Revalidation headers for a stale cache entry, if it has an ETag."""
+    if cached is not None and cached.etag:
+        return {'If-None-Match': cached.etag}
+    return {}
+
+
+def _cache_response(
+    key: Tuple,
+    body: Dict[str, Any],
+    headers: Mapping[str, str],
+    revalidated: Optional[_CachedResponse] = None
+) -> None:
+    """
+    Store a successful response, honouring its Cache-Control header.
+    
+    Responses without Cache-Control never go stale, since the key already
+    pins the exact file bytes. no-store responses are not cached;
+    max-age and no-cache set when the entry must be revalidated. A 304
+    often omits these headers, so the revalidated entry's ETag and
+    freshness lifetime carry over unless the 304 replaces them.
+    """
+    cache_control = headers.get('Cache-Control', '').lower()
+    if 'no-store' in cache_control:
+        _response_cache.pop(key)
+        return
+    
+    if 'no-cache' in cache_control:
+        max_age = 0
+    elif match := _MAX_AGE_RE.search(cache_control):
+        max_age = int(match.group(1))
+    elif revalidated is not None:
+        max_age = revalidated.max_age
+    else:
+        max_age = None
+    
+    etag = headers.get('ETag')
+    if etag is None and revalidated is not None:
+        etag = revalidated.etag
+    
+    expires = None if max_age is None else time.monotonic() + max_age
+    _response_cache.put(key, _CachedResponse(body, etag, expires, max_age))
+
+
+# Maximum in-flight requests per async batch
+_ASYNC_CONCURRENCY = 16
+
+# Streaming batches stop admitting uploads above this fraction of their memory cap
+_MEMORY_THROTTLE_RATIO = 0.8
+
+# Texts per batched {"inputs": [...]} request
+_TEXT_BATCH_SIZE = 16
+
+# Files per multi-file multipart request
+_FILE_BATCH_SIZE = 8
+
+# Endpoints that rejected batched text inputs; these get one request per text
+_unbatched_urls: set = set()
+
+# Endpoints that rejected multi-file uploads; these get one request per file.
+# Kept apart from _unbatched_urls since one URL may serve texts and files.
+_single_file_urls: set = set()
+
+# Replies meaning the endpoint cannot parse a batched request, e.g. a
+# 422 from a form endpoint sent JSON
+_BATCH_UNSUPPORTED_STATUSES = frozenset({400, 404, 405, 415, 422})
+
+
+def _loads_or_none(content: bytes) -> Any:
+    """
+    Decode a JSON body straight from the response bytes.
+    
+    Args:
+        content: Raw response body.
+    
+    Returns:
+        Decoded JSON, or None if the body is not valid JSON.
+    """
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return None
+
+
+def _batch_results(status_code: int, body: Any, count: int) -> Optional[List[Any]]:
+    """
+    Validate a batched response.
+    
+    Args:
+        status_code: HTTP status of the batched request.
+        body: Decoded JSON body, or None if it was not JSON.
+        count: Number of texts sent.
+    
+    Returns:
+        One result per text, or None if the endpoint does not support
+        batched inputs.
+    """
+    if status_code in _BATCH_UNSUPPORTED_STATUSES or not isinstance(body, list) or len(body) != count:
+        return None
+    return body
+
+
+async def _gather_bounded(
+    coros: Iterable[Awaitable[T]],
+    concurrency: int
+) -> List[T]:
+    """
+    Await coroutines concurrently with at most `concurrency` in flight.
+    
+    Args:
+        coros: Coroutines to run.
+        concurrency: Maximum number running at once.
+    
+    Returns:
+        Results, in input order.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def bounded(coro: Awaitable[T]) -> T:
+        async with semaphore:
+            return await coro
+    
+    return list(await asyncio.gather(*(bounded(coro) for coro in coros)))
+
+
+def _chunks(items: List[str], size: int) -> List[List[str]]:
+    """Split items into consecutive chunks of at most size."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _supports_text_batching(url: str) -> bool:
+    """Whether url is configured for batched text inputs and has not rejected them."""
+    return url in settings.http.batch_text_urls and url not in _unbatched_urls
+
+
+def _supports_multi_file(url: str) -> bool:
+    """Whether url is configured for multi-file uploads and has not rejected one."""
+    return url in settings.http.multi_file_urls and url not in _single_file_urls
+
+
+def _precheck_file(file_path: str) -> Optional[ProcessingResult]:
+    """
+    Stat a file before upload, so bad paths are rejected without opening them.
+    
+    Args:
+        file_path: Path to the file to upload.
+    
+    Returns:
+        Error result for a missing or empty file, or None if it can be sent.
+    """
+    try:
+        size = os.stat(file_path).st_size
+    except FileNotFoundError:
+        logger.error("File not found: %s", file_path)
+        return ProcessingResult(False, None, f"File not found: {file_path}")
+    if size == 0:
+        logger.error("Empty file: %s", file_path)
+        return ProcessingResult(False, None, "empty file")
+    return None
+
+
+def _file_upload_request(
+    f: BinaryIO,
+    file_path: str,
+    extra_data: Optional[Dict[str, str]],
+    cached: Optional[_CachedResponse]
+) -> Dict[str, Any]:
+    """
+    Build _post arguments for a single file upload.
+    
+    The sync and async paths share this so endpoints see the same request
+    either way: the file as an octet-stream 'file' part, streamed from
+    disk in chunks, plus a 'filename' field and extra_data.
+    
+    Args:
+        f: File opened in binary mode.
+        file_path: Path the file was opened from.
+        extra_data: Additional form data.
+        cached: Stale cache entry to revalidate, if any.
+    
+    Returns:
+        Keyword arguments for _post or _apost.
+    """
+    file_name = Path(file_path).name
+    return {
+        "rewind": f,
+        "files": {'file': (file_name, f, 'application/octet-stream')},
+        "data": {'filename': file_name, **(extra_data or {})},
+        "headers": _conditional_headers(cached),
+    }
+
+
+def _file_upload_result(
+    cache_key: Tuple,
+    cached: Optional[_CachedResponse],
+    response: httpx.Response
+) -> ProcessingResult:
+    """
+    Decode a file upload response and update the response cache.
+    
+    A 304 reuses the body of the cache entry being revalidated.
+    
+    Args:
+        cache_key: Response cache key for the upload.
+        cached: Stale cache entry that was revalidated, if any.
+        response: Server response.
+    
+    Returns:
+        Result holding the decoded response.
+    
+    Raises:
+        httpx.HTTPStatusError: If the server returned an error status.
+        orjson.JSONDecodeError: If the body is not valid JSON.
+    """
+    revalidated = cached if response.status_code == 304 else None
+    if revalidated is not None:
+        result = revalidated.body
+    else:
+        response.raise_for_status()
+        result = orjson.loads(response.content)
+    _cache_response(cache_key, result, response.headers, revalidated)
+    return ProcessingResult(True, result)
+
+
+# Failures a single file upload reports as an error result
+_FILE_UPLOAD_ERRORS = (httpx.HTTPError, orjson.JSONDecodeError, FileNotFoundError)
+
+
+def _file_upload_error(url: str, file_path: str, error: Exception) -> ProcessingResult:
+    """Log a failed file upload and convert it to an error result."""
+    if isinstance(error, FileNotFoundError):
+        logger.error("File not found: %s", file_path)
+        return ProcessingResult(False, None, f"File not found: {file_path}")
+    if isinstance(error, orjson.JSONDecodeError):
+        logger.error("Invalid JSON from %s: %s", url, error)
+        return ProcessingResult(False, None, f"Invalid JSON response: {error}")
+    logger.error("API call failed for %s: %s", url, error)
+    return ProcessingResult(False, None, str(error))
+
+
+def _precheck_files(
+    file_paths: List[str]
+) -> Tuple[List[Optional[ProcessingResult]], List[str]]:
+    """
+    Precheck a batch of files once, before any of them is opened.
+    
+    Args:
+        file_paths: Paths to upload.
+    
+    Returns:
+        One slot per path holding its error result or None, and the
+        paths that passed, in order.
+    """
+    results = [_precheck_file(path) for path in file_paths]
+    valid_paths = [path for path, result in zip(file_paths, results) if result is None]
+    return results, valid_paths
+
+
+def _open_file_parts(
+    stack: ExitStack,
+    file_paths: List[str]
+) -> Tuple[List[Tuple[str, Tuple[str, BinaryIO, str]]], List[Optional[ProcessingResult]]]:
+    """
+    Open files as multipart parts named file_0..file_K-1.
+    
+    Paths are expected to have passed _precheck_file; a file removed since
+    then is left out of the request and gets an error result.
+    
+    Args:
+        stack: Exit stack that closes the opened files.
+        file_paths: Prechecked paths to upload.
+    
+    Returns:
+        Multipart file parts, and one slot per path holding either its
+        error result or None if the file is being sent.
+    """
+    parts = []
+    results: List[Optional[ProcessingResult]] = []
+    for path in file_paths:
+        try:
+            f = stack.enter_context(open(path, 'rb'))
+        except FileNotFoundError:
+            logger.error("File not found: %s", path)
+            results.append(ProcessingResult(False, None, f"File not found: {path}"))
+            continue
+        parts.append((f'file_{len(parts)}', (Path(path).name, f, 'application/octet-stream')))
+        results.append(None)
+    return parts, results
+
+
+def _merge_file_results(
+    results: List[Optional[ProcessingResult]],
+    sub_results: Iterable[ProcessingResult]
+) -> List[ProcessingResult]:
+    """Fill the slots of sent files with their sub-responses, in order."""
+    sub_results = iter(sub_results)
+    return [next(sub_results) if result is None else result for result in results]
+
 
 def call_api_with_file(
     url: str,
     file_path: str,
     extra_data: Optional[Dict[str, str]] = None
-) -> Dict[str, Any]:
+) -> ProcessingResult:
     """
     Make API call with file upload.
     
@@ -24,30 +817,38 @@ def call_api_with_file(
         extra_data: Additional form data.
     
     Returns:
-        API response as dict.
+        Result holding the decoded response, or the error.
     """
+    error = _precheck_file(file_path)
+    if error is not None:
+        return error
+    return _upload_file(url, file_path, extra_data)
+
+
+def _upload_file(
+    url: str,
+    file_path: str,
+    extra_data: Optional[Dict[str, str]] = None
+) -> ProcessingResult:
+    """call_api_with_file for a path that already passed _precheck_file."""
     try:
         with open(file_path, 'rb') as f:
-            files = {'file': f}
-            data = {'filename': Path(file_path).name}
-            if extra_data:
-                data.update(extra_data)
-            response = requests.post(url, files=files, data=data, timeout=60)
-            response.raise_for_status()
-            return response.json()
-    except requests.RequestException as e:
-        logger.error(f"API call failed for {url}: {e}")
-        return {"error": str(e)}
-    except FileNotFoundError:
-        logger.error(f"File not found: {file_path}")
-        return {"error": f"File not found: {file_path}"}
+            cache_key = _file_cache_key(url, f, file_path, extra_data)
+            cached = _response_cache.get(cache_key)
+            if cached is not None and cached.is_fresh():
+                return ProcessingResult(True, cached.body)
+            
+            response = _post(url, **_file_upload_request(f, file_path, extra_data, cached))
+            return _file_upload_result(cache_key, cached, response)
+    except _FILE_UPLOAD_ERRORS as e:
+        return _file_upload_error(url, file_path, e)
 
 
 def call_api_with_text(
     url: str,
     text: str,
     extra_data: Optional[Dict[str, str]] = None
-) -> Dict[str, Any]:
+) -> ProcessingResult:
     """
     Make API call with text data.
     
@@ -57,53 +858,508 @@ def call_api_with_text(
         extra_data: Additional form data.
     
     Returns:
-        API response as dict.
+        Result holding the decoded response, or the error.
     """
     try:
         data = {'text': text}
         if extra_data:
             data.update(extra_data)
-        response = requests.post(url, data=data, timeout=60)
+        response = _post_body(url, urlencode(data).encode(), _FORM_CONTENT_TYPE)
         response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        logger.error(f"API call failed for {url}: {e}")
-        return {"error": str(e)}
+        return ProcessingResult(True, orjson.loads(response.content))
+    except httpx.HTTPError as e:
+        logger.error("API call failed for %s: %s", url, e)
+        return ProcessingResult(False, None, str(e))
+    except orjson.JSONDecodeError as e:
+        logger.error("Invalid JSON from %s: %s", url, e)
+        return ProcessingResult(False, None, f"Invalid JSON response: {e}")
 
 
-def process_files_batch(
+def call_api_with_files(
+    url: str,
+    file_paths: List[str],
+    extra_data: Optional[Dict[str, str]] = None
+) -> List[ProcessingResult]:
+    """
+    Upload several files in one multipart request.
+    
+    Files are sent as file_0..file_K-1 alongside extra_data, and the
+    endpoint must answer with a JSON list of one result per file.
+    Endpoints that do not are remembered and sent one request per file
+    instead. Responses are not cached, unlike call_api_with_file.
+    
+    Args:
+        url: API endpoint URL.
+        file_paths: Paths to files to upload.
+        extra_data: Additional form data.
+    
+    Returns:
+        List of results, one per file.
+    """
+    results, valid_paths = _precheck_files(file_paths)
+    return _merge_file_results(results, _upload_files(url, valid_paths, extra_data))
+
+
+def _upload_files(
     url: str,
     file_paths: List[str],
     extra_data: Optional[Dict[str, str]] = None
-) -> List[Dict[str, Any]]:
+) -> List[ProcessingResult]:
+    """call_api_with_files for paths that already passed _precheck_file."""
+    with ExitStack() as stack:
+        parts, results = _open_file_parts(stack, file_paths)
+        if not parts:
+            return results
+        try:
+            response = _post(url, files=parts, data=extra_data or {})
+            if response.status_code not in _BATCH_UNSUPPORTED_STATUSES:
+                response.raise_for_status()
+            body = _loads_or_none(response.content)
+            sub_results = _batch_results(response.status_code, body, len(parts))
+            if sub_results is not None:
+                return _merge_file_results(
+                    results, (ProcessingResult(True, sub_result) for sub_result in sub_results)
+                )
+        except httpx.HTTPError as e:
+            logger.error("API call failed for %s: %s", url, e)
+            return _merge_file_results(
+                results, (ProcessingResult(False, None, str(e)) for _ in parts)
+            )
+    
+    _single_file_urls.add(url)
+    logger.info("Multi-file uploads not supported by %s, sending files individually", url)
+    return [_upload_file(url, path, extra_data) for path in file_paths]
+
+
+def process_files_batch(
+    url: str,
+    file_paths: List[str],
+    extra_data: Optional[Dict[str, str]] = None,
+    batch_size: int = _FILE_BATCH_SIZE
+) -> List[ProcessingResult]:
     """
-    Process multiple files through an API endpoint.
+    Process multiple files through an API endpoint concurrently.
+    
+    Endpoints listed in HTTP_MULTI_FILE_URLS get batch_size files per
+    request; all others get one request per file. Missing and empty files
+    are rejected before any upload and keep an error result in their slot.
     
     Args:
         url: API endpoint URL.
         file_paths: List of file paths.
         extra_data: Additional form data for each request.
+        batch_size: Maximum files per multi-file request.
+    
+    Returns:
+        List of results, in input order.
+    """
+    results, valid_paths = _precheck_files(file_paths)
+    
+    if _supports_multi_file(url):
+        batches = _pool.map(
+            lambda chunk: _upload_files(url, chunk, extra_data),
+            _chunks(valid_paths, batch_size)
+        )
+        sent = [result for batch in batches for result in batch]
+    else:
+        sent = _pool.map(
+            lambda path: _upload_file(url, path, extra_data),
+            valid_paths
+        )
+    return _merge_file_results(results, sent)
+
+
+def call_api_with_texts(
+    url: str,
+    texts: List[str],
+    extra_data: Optional[Dict[str, str]] = None
+) -> List[ProcessingResult]:
+    """
+    Make one API call for several texts.
+    
+    Sends {"inputs": texts, **extra_data} as JSON. Endpoints that reject
+    this (400, 404, 405, 415, or 422) or answer with anything but one
+    result per text are remembered and sent one request per text instead.
+    
+    Args:
+        url: API endpoint URL.
+        texts: Text contents to send.
+        extra_data: Additional request parameters.
     
     Returns:
-        List of API responses.
+        List of results, one per text.
     """
-    return [call_api_with_file(url, path, extra_data) for path in file_paths]
+    if url not in _unbatched_urls:
+        try:
+            response = _post_body(
+                url, orjson.dumps({"inputs": texts, **(extra_data or {})}), _JSON_CONTENT_TYPE
+            )
+            if response.status_code not in _BATCH_UNSUPPORTED_STATUSES:
+                response.raise_for_status()
+            body = _loads_or_none(response.content)
+            results = _batch_results(response.status_code, body, len(texts))
+            if results is not None:
+                return [ProcessingResult(True, result) for result in results]
+        except httpx.HTTPError as e:
+            logger.error("API call failed for %s: %s", url, e)
+            return [ProcessingResult(False, None, str(e)) for _ in texts]
+        
+        _unbatched_urls.add(url)
+        logger.info("Batched inputs not supported by %s, sending texts individually", url)
+    
+    return [call_api_with_text(url, text, extra_data) for text in texts]
 
 
 def process_texts_batch(
+    url: str,
+    texts: List[str],
+    extra_data: Optional[Dict[str, str]] = None,
+    batch_size: int = _TEXT_BATCH_SIZE
+) -> List[ProcessingResult]:
+    """
+    Process multiple texts through an API endpoint concurrently.
+    
+    Endpoints listed in HTTP_BATCH_TEXT_URLS get batch_size texts per
+    request; all others get one form request per text.
+    
+    Args:
+        url: API endpoint URL.
+        texts: List of text strings.
+        extra_data: Additional form data for each request.
+        batch_size: Maximum texts per batched request.
+    
+    Returns:
+        List of results, in input order.
+    """
+    if _supports_text_batching(url):
+        batches = _pool.map(
+            lambda chunk: call_api_with_texts(url, chunk, extra_data),
+            _chunks(texts, batch_size)
+        )
+        return [result for batch in batches for result in batch]
+    
+    return list(_pool.map(
+        lambda text: call_api_with_text(url, text, extra_data),
+        texts
+    ))
+
+
+async def acall_api_with_file(
+    url: str,
+    file_path: str,
+    extra_data: Optional[Dict[str, str]] = None
+) -> ProcessingResult:
+    """
+    Make async API call with file upload.
+    
+    Args:
+        url: API endpoint URL.
+        file_path: Path to file to upload.
+        extra_data: Additional form data.
+    
+    Returns:
+        Result holding the decoded response, or the error.
+    """
+    error = _precheck_file(file_path)
+    if error is not None:
+        return error
+    return await _aupload_file(url, file_path, extra_data)
+
+
+async def _aupload_file(
+    url: str,
+    file_path: str,
+    extra_data: Optional[Dict[str, str]] = None
+) -> ProcessingResult:
+    """acall_api_with_file for a path that already passed _precheck_file."""
+    try:
+        with open(file_path, 'rb') as f:
+            cache_key = await asyncio.to_thread(_file_cache_key, url, f, file_path, extra_data)
+            cached = _response_cache.get(cache_key)
+            if cached is not None and cached.is_fresh():
+                return ProcessingResult(True, cached.body)
+            
+            response = await _apost(url, **_file_upload_request(f, file_path, extra_data, cached))
+            return _file_upload_result(cache_key, cached, response)
+    except _FILE_UPLOAD_ERRORS as e:
+        return _file_upload_error(url, file_path, e)
+
+
+async def acall_api_with_text(
+    url: str,
+    text: str,
+    extra_data: Optional[Dict[str, str]] = None
+) -> ProcessingResult:
+    """
+    Make async API call with text data.
+    
+    Args:
+        url: API endpoint URL.
+        text: Text content to send.
+        extra_data: Additional form data.
+    
+    Returns:
+        Result holding the decoded response, or the error.
+    """
+    try:
+        data = {'text': text}
+        if extra_data:
+            data.update(extra_data)
+        response = await _apost_body(url, urlencode(data).encode(), _FORM_CONTENT_TYPE)
+        response.raise_for_status()
+        return ProcessingResult(True, orjson.loads(response.content))
+    except httpx.HTTPError as e:
+        logger.error("API call failed for %s: %s", url, e)
+        return ProcessingResult(False, None, str(e))
+    except orjson.JSONDecodeError as e:
+        logger.error("Invalid JSON from %s: %s", url, e)
+        return ProcessingResult(False, None, f"Invalid JSON response: {e}")
+
+
+async def acall_api_with_files(
+    url: str,
+    file_paths: List[str],
+    extra_data: Optional[Dict[str, str]] = None
+) -> List[ProcessingResult]:
+    """Async variant of call_api_with_files."""
+    results, valid_paths = _precheck_files(file_paths)
+    return _merge_file_results(results, await _aupload_files(url, valid_paths, extra_data))
+
+
+async def _aupload_files(
+    url: str,
+    file_paths: List[str],
+    extra_data: Optional[Dict[str, str]] = None
+) -> List[ProcessingResult]:
+    """acall_api_with_files for paths that already passed _precheck_file."""
+    with ExitStack() as stack:
+        parts, results = _open_file_parts(stack, file_paths)
+        if not parts:
+            return results
+        try:
+            response = await _apost(url, files=parts, data=extra_data or {})
+            if response.status_code not in _BATCH_UNSUPPORTED_STATUSES:
+                response.raise_for_status()
+            body = _loads_or_none(response.content)
+            sub_results = _batch_results(response.status_code, body, len(parts))
+            if sub_results is not None:
+                return _merge_file_results(
+                    results, (ProcessingResult(True, sub_result) for sub_result in sub_results)
+                )
+        except httpx.HTTPError as e:
+            logger.error("API call failed for %s: %s", url, e)
+            return _merge_file_results(
+                results, (ProcessingResult(False, None, str(e)) for _ in parts)
+            )
+    
+    _single_file_urls.add(url)
+    logger.info("Multi-file uploads not supported by %s, sending files individually", url)
+    return list(await asyncio.gather(
+        *(_aupload_file(url, path, extra_data) for path in file_paths)
+    ))
+
+
+async def aprocess_files_batch(
+    url: str,
+    file_paths: List[str],
+    extra_data: Optional[Dict[str, str]] = None,
+    concurrency: int = _ASYNC_CONCURRENCY,
+    batch_size: int = _FILE_BATCH_SIZE
+) -> List[ProcessingResult]:
+    """
+    Process multiple files through an API endpoint concurrently.
+    
+    Endpoints listed in HTTP_MULTI_FILE_URLS get batch_size files per
+    request; all others get one request per file. Missing and empty files
+    are rejected before any upload and keep an error result in their slot.
+    
+    Args:
+        url: API endpoint URL.
+        file_paths: List of file paths.
+        extra_data: Additional form data for each request.
+        concurrency: Maximum requests in flight.
+        batch_size: Maximum files per multi-file request.
+    
+    Returns:
+        List of results, in input order.
+    """
+    results, valid_paths = _precheck_files(file_paths)
+    
+    if _supports_multi_file(url):
+        batches = await _gather_bounded(
+            (_aupload_files(url, chunk, extra_data) for chunk in _chunks(valid_paths, batch_size)),
+            concurrency
+        )
+        sent = [result for batch in batches for result in batch]
+    else:
+        sent = await _gather_bounded(
+            (_aupload_file(url, path, extra_data) for path in valid_paths),
+            concurrency
+        )
+    return _merge_file_results(results, sent)
+
+
+async def aprocess_files_batch_streaming(
+    url: str,
+    file_paths: Iterable[str],
+    extra_data: Optional[Dict[str, str]] = None,
+    max_in_flight: int = 8,
+    max_memory_bytes: int = 256 * 1024 * 1024
+) -> AsyncIterator[Tuple[str, ProcessingResult]]:
+    """
+    Upload files with bounded memory, yielding responses as they complete.
+    
+    Paths are pulled from the iterable only as slots free up, so at most
+    max_in_flight uploads are open at once. While process RSS is above
+    80% of max_memory_bytes, no new uploads start until one finishes.
+    Results are yielded rather than collected, so callers can process
+    and drop them.
+    
+    Args:
+        url: API endpoint URL.
+        file_paths: Iterable of file paths; may be a lazy generator.
+        extra_data: Additional form data for each request.
+        max_in_flight: Maximum concurrent uploads.
+        max_memory_bytes: Soft RSS cap for this process.
+    
+    Yields:
+        (file_path, result) tuples in completion order.
+    """
+    process = psutil.Process()
+    throttle_bytes = max_memory_bytes * _MEMORY_THROTTLE_RATIO
+    paths = iter(file_paths)
+    pending: Set["asyncio.Task[Tuple[str, ProcessingResult]]"] = set()
+    exhausted = False
+    
+    async def upload(path: str) -> Tuple[str, ProcessingResult]:
+        return path, await acall_api_with_file(url, path, extra_data)
+    
+    try:
+        while True:
+            while not exhausted and len(pending) < max_in_flight:
+                # Always keep one upload running so throttling cannot stall
+                if pending and process.memory_info().rss > throttle_bytes:
+                    break
+                path = next(paths, None)
+                if path is None:
+                    exhausted = True
+                    break
+                pending.add(asyncio.create_task(upload(path)))
+            
+            if not pending:
+                return
+            
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _acall_api_with_file_in_child(
+    url: str,
+    extra_data: Optional[Dict[str, str]],
+    file_path: str
+) -> ProcessingResult:
+    """Pool worker for aprocess_files_batch_mp; argument order suits partial()."""
+    return await acall_api_with_file(url, file_path, extra_data)
+
+
+async def aprocess_files_batch_mp(
+    url: str,
+    file_paths: List[str],
+    extra_data: Optional[Dict[str, str]] = None,
+    processes: Optional[int] = None,
+    childconcurrency: int = _ASYNC_CONCURRENCY
+) -> List[ProcessingResult]:
+    """
+    Process files across worker processes, each running its own event loop.
+    
+    For very large batches where client-side work (hashing, JSON decoding)
+    saturates one core. Each child builds its own async client on its own
+    loop, since clients cannot cross process boundaries.
+    
+    Args:
+        url: API endpoint URL.
+        file_paths: List of file paths.
+        extra_data: Additional form data for each request.
+        processes: Worker processes; defaults to the CPU count.
+        childconcurrency: Concurrent uploads per worker.
+    
+    Returns:
+        List of results, in input order.
+    """
+    async with aiomultiprocess.Pool(
+        processes=processes or os.cpu_count(),
+        childconcurrency=childconcurrency
+    ) as pool:
+        return await pool.map(
+            partial(_acall_api_with_file_in_child, url, extra_data),
+            file_paths
+        )
+
+
+async def acall_api_with_texts(
     url: str,
     texts: List[str],
     extra_data: Optional[Dict[str, str]] = None
-) -> List[Dict[str, Any]]:
+) -> List[ProcessingResult]:
+    """Async variant of call_api_with_texts."""
+    if url not in _unbatched_urls:
+        try:
+            response = await _apost_body(
+                url, orjson.dumps({"inputs": texts, **(extra_data or {})}), _JSON_CONTENT_TYPE
+            )
+            if response.status_code not in _BATCH_UNSUPPORTED_STATUSES:
+                response.raise_for_status()
+            body = _loads_or_none(response.content)
+            results = _batch_results(response.status_code, body, len(texts))
+            if results is not None:
+                return [ProcessingResult(True, result) for result in results]
+        except httpx.HTTPError as e:
+            logger.error("API call failed for %s: %s", url, e)
+            return [ProcessingResult(False, None, str(e)) for _ in texts]
+        
+        _unbatched_urls.add(url)
+        logger.info("Batched inputs not supported by %s, sending texts individually", url)
+    
+    return list(await asyncio.gather(
+        *(acall_api_with_text(url, text, extra_data) for text in texts)
+    ))
+
+
+async def aprocess_texts_batch(
+    url: str,
+    texts: List[str],
+    extra_data: Optional[Dict[str, str]] = None,
+    batch_size: int = _TEXT_BATCH_SIZE,
+    concurrency: int = _ASYNC_CONCURRENCY
+) -> List[ProcessingResult]:
     """
-    Process multiple texts through an API endpoint.
+    Process multiple texts through an API endpoint concurrently.
+    
+    Endpoints listed in HTTP_BATCH_TEXT_URLS get batch_size texts per
+    request; all others get one form request per text.
     
     Args:
         url: API endpoint URL.
         texts: List of text strings.
         extra_data: Additional form data for each request.
+        batch_size: Maximum texts per batched request.
+        concurrency: Maximum requests in flight.
     
     Returns:
-        List of API responses.
+        List of results, in input order.
     """
-    return [call_api_with_text(url, text, extra_data) for text in texts]
+    if _supports_text_batching(url):
+        batches = await _gather_bounded(
+            (acall_api_with_texts(url, chunk, extra_data) for chunk in _chunks(texts, batch_size)),
+            concurrency
+        )
+        return [result for batch in batches for result in batch]
+    
+    return await _gather_bounded(
+        (acall_api_with_text(url, text, extra_data) for text in texts),
+        concurrency
+    )
@@ -0,0 +1,31 @@
+"""
+LLM client utilities.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+
+@lru_cache(maxsize=1)
+def get_llm(model: str, temperature: float, api_key: str) -> "ChatGoogleGenerativeAI":
+    """
+    Get a chat model client, constructing it only once per configuration.
+    
+    Args:
+        model: Model name.
+        temperature: Sampling temperature.
+        api_key: Google API key.
+    
+    Returns:
+        Cached chat model client.
+    """
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    
+    return ChatGoogleGenerativeAI(
+        model=model,
+        temperature=temperature,
+        api_key=api_key
+    )